@@ -1,14 +1,20 @@
 from __future__ import annotations
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, List
 import joblib
+import numpy as np
+import orjson
 import pandas as pd
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-from .predict import categorize
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from .kernels import categorize_many, risk_codes
+from .predict import load_bundle, make_categorizer
 
 class CreditRequest(BaseModel):
     checking_status: str
@@ -36,12 +42,32 @@ class CreditResponse(BaseModel):
     prob_default: float
     risk: str
 
+# CreditRequest declares its fields in training column order; _load_bundle
+# checks this so request values can be read positionally without a reindex
+_FIELDS: tuple[str, ...] = tuple(CreditRequest.model_fields)
+
+# The request schema is fixed, so its categorical (str) fields are known up front
+_CAT_COLS: tuple[str, ...] = tuple(
+    name for name, field in CreditRequest.model_fields.items() if field.annotation is str
+)
+
+# Validates a whole /predict_batch body in one pydantic-core call
+_BATCH_ADAPTER = TypeAdapter(List[CreditRequest])
+# /predict_batch_fast's cheap per-value type check, in field order
+_FIELD_TYPES = tuple(str if name in _CAT_COLS else (int, float) for name in _FIELDS)
+
+# Set CREDIT_API_DOCS=0 to hide the interactive docs in production
+_DOCS_ENABLED = os.environ.get("CREDIT_API_DOCS", "1") == "1"
+# /predict_batch_fast skips item validation, so it stays off unless CREDIT_API_FAST_BATCH=1
+_FAST_BATCH_ENABLED = os.environ.get("CREDIT_API_FAST_BATCH") == "1"
+
 app = FastAPI(
     title="Credit Risk API", 
     version="1.0.0",
     description="AI-Powered Credit Risk Assessment System",
-    docs_url="/docs",
-    redoc_url="/redoc"
+    docs_url="/docs" if _DOCS_ENABLED else None,
+    redoc_url="/redoc" if _DOCS_ENABLED else None,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -52,30 +78,64 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Project paths, resolved once at import
+_ROOT = Path(__file__).resolve().parents[1]
+_MODELS_DIR = _ROOT / "models"
+_BEST_PATH = _MODELS_DIR / "credit_model_best.joblib"
+_REGULAR_PATH = _MODELS_DIR / "credit_model.joblib"
+
+# Landing page is static, so read and encode it once at import
+_ROOT_HTML_BYTES = (Path(__file__).parent / "static" / "index.html").read_bytes()
+
+# Bounded pool for CPU-bound model calls so they never block the event loop
+_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="predict")
+
+# Concurrent /predict calls are coalesced into one predict_proba call of up to
+# _BATCH_MAX_SIZE rows; a lone request is scored immediately, and only while an
+# earlier batch is still scoring does the batcher wait CREDIT_API_BATCH_WAIT_MS for company
+_BATCH_MAX_SIZE = 64
+_BATCH_MAX_WAIT = float(os.environ.get("CREDIT_API_BATCH_WAIT_MS", "5")) / 1000
+_INBOX: asyncio.Queue | None = None
+# Large batches are scored in row tiles so each tile's feature matrix stays cache-resident
+_TILE_ROWS = int(os.environ.get("CREDIT_API_BATCH_TILE", "4096"))
+_BATCHER: asyncio.Task | None = None
+
 # Global variables for model
 _BUNDLE: dict | None = None
 _PIPE = None
-_FEATURE_COLUMNS: list[str] = []
+_FEATURE_COLUMNS: tuple[str, ...] = ()
 _THRESHOLDS: dict[str, float] = {}
+_CATEGORIZE = make_categorizer({"low": 0.20, "medium": 0.50})
 _PROBA_IDX: int = 0
+# Scoring function: the folded weights below for train.py's LogisticRegression
+# pipeline, otherwise the pipeline's own predict_proba
+_PREDICT_PROBA = None
+# The standard train.py pipeline folded into per-feature weights: numeric columns
+# (index, weight/scale, impute value) and per-categorical-column {category: weight}
+_NUM_IDX: list[int] = []
+_NUM_COEF: np.ndarray | None = None
+_NUM_FILL: np.ndarray | None = None
+_CAT_COEF: list[tuple[int, dict[str, float]]] = []
+_INTERCEPT: float = 0.0
+_RAW_ROWS = False  # scoring function takes raw value rows instead of a frame
+# Per-column {category: code} lookups for models that consume encoded
+# categoricals (the fallback model); empty when the pipeline encodes itself.
+_CAT_MAPS: dict[str, dict[str, int]] = {}
+# _CAT_MAPS laid out by column position (None for numeric columns)
+_CODE_LUT: tuple[dict[str, int] | None, ...] = ()
 
 def _train_model_if_needed():
     """Train model if it doesn't exist"""
-    root = Path(__file__).resolve().parents[1]
-    models_dir = root / "models"
-    models_dir.mkdir(exist_ok=True)
+    _MODELS_DIR.mkdir(exist_ok=True)
     
-    best = models_dir / "credit_model_best.joblib"
-    regular = models_dir / "credit_model.joblib"
-    
-    if not best.exists() and not regular.exists():
+    if not _BEST_PATH.exists() and not _REGULAR_PATH.exists():
         print("🤖 No trained model found. Training new model...")
         try:
             # Import and run training
             import subprocess
             import sys
             result = subprocess.run([sys.executable, "-m", "src.train"], 
-                                  capture_output=True, text=True, cwd=root)
+                                  capture_output=True, text=True, cwd=_ROOT)
             if result.returncode != 0:
                 print(f"Training failed: {result.stderr}")
                 raise Exception("Model training failed")
@@ -83,7 +143,7 @@ def _train_model_if_needed():
         except Exception as e:
             print(f"❌ Training error: {e}")
             # Create a simple fallback model for demo
-            _create_fallback_model(regular)
+            _create_fallback_model(_REGULAR_PATH)
 
 def _create_fallback_model(path):
     """Create a simple fallback model for demo purposes"""
@@ -91,7 +151,6 @@ def _create_fallback_model(path):
     from sklearn.ensemble import RandomForestClassifier
     from sklearn.pipeline import Pipeline
     from sklearn.preprocessing import LabelEncoder
-    import numpy as np
     
     # Simple demo model
     pipe = Pipeline([
@@ -106,70 +165,164 @@ def _create_fallback_model(path):
         'num_dependents', 'own_telephone', 'foreign_worker'
     ]
     
-    # Create dummy training data
-    np.random.seed(42)
-    dummy_data = []
-    for _ in range(100):
-        dummy_data.append({
-            'checking_status': np.random.choice(['<0', '0<=X<200', '>=200', 'no checking']),
-            'duration': np.random.randint(6, 48),
-            'credit_history': 'existing paid',
-            'purpose': 'car (new)',
-            'credit_amount': np.random.randint(1000, 10000),
-            'savings_status': '<100',
-            'employment': '>=7',
-            'installment_commitment': 2,
-            'personal_status': 'male single',
-            'other_parties': 'none',
-            'residence_since': 3,
-            'property_magnitude': 'real estate',
-            'age': np.random.randint(18, 70),
-            'other_payment_plans': 'none',
-            'housing': 'own',
-            'existing_credits': 1,
-            'job': 'skilled',
-            'num_dependents': 1,
-            'own_telephone': 'yes',
-            'foreign_worker': 'yes'
-        })
-    
-    X = pd.DataFrame(dummy_data)
-    y = np.random.choice(['good', 'bad'], size=100)
+    # Create dummy training data, one vectorized draw per column
+    rng = np.random.default_rng(42)
+    n = 100
+    X = pd.DataFrame({
+        'checking_status': rng.choice(['<0', '0<=X<200', '>=200', 'no checking'], size=n),
+        'duration': rng.integers(6, 48, size=n),
+        'credit_history': 'existing paid',
+        'purpose': 'car (new)',
+        'credit_amount': rng.integers(1000, 10000, size=n),
+        'savings_status': '<100',
+        'employment': '>=7',
+        'installment_commitment': 2,
+        'personal_status': 'male single',
+        'other_parties': 'none',
+        'residence_since': 3,
+        'property_magnitude': 'real estate',
+        'age': rng.integers(18, 70, size=n),
+        'other_payment_plans': 'none',
+        'housing': 'own',
+        'existing_credits': 1,
+        'job': 'skilled',
+        'num_dependents': 1,
+        'own_telephone': 'yes',
+        'foreign_worker': 'yes'
+    }, columns=feature_columns)
+    y = rng.choice(['good', 'bad'], size=n)
     
     # Simple encoding for categorical variables
-    for col in X.select_dtypes(include=['object']).columns:
+    category_maps = {}
+    for col in _CAT_COLS:
         le = LabelEncoder()
         X[col] = le.fit_transform(X[col].astype(str))
+        category_maps[col] = {cls: i for i, cls in enumerate(le.classes_.tolist())}
     
-    pipe.fit(X, y)
-    pipe.classes_ = ['good', 'bad']  # Ensure classes are set
+    pipe.fit(X.to_numpy(dtype=np.float32), y)
     
     bundle = {
         'pipeline': pipe,
         'feature_columns': feature_columns,
+        'category_maps': category_maps,
         'thresholds': {'low': 0.20, 'medium': 0.50}
     }
     
-    joblib.dump(bundle, path)
+    joblib.dump(bundle, path, compress=0)  # uncompressed so the API can mmap it
     print("✅ Fallback model created!")
 
-def _load_bundle():
-    global _BUNDLE, _PIPE, _FEATURE_COLUMNS, _THRESHOLDS, _PROBA_IDX
+def _model_input(rows: list[tuple[Any, ...]]):
+    """Turn raw value rows (in _FEATURE_COLUMNS) into what the loaded pipeline expects"""
+    if _CAT_MAPS:
+        # Fallback model takes a plain float32 matrix with training-time category codes
+        return np.array(
+            [[value if lut is None else lut.get(value, -1) for value, lut in zip(row, _CODE_LUT)] for row in rows],
+            dtype=np.float32,
+        )
+    if _RAW_ROWS:
+        return rows
+    # Trained pipeline selects columns by name, so it needs a frame
+    return pd.DataFrame.from_records(rows, columns=_FEATURE_COLUMNS)
+
+def _folded_predict_proba(rows):
+    """Same output as the pipeline's predict_proba, computed from raw rows with the
+    preprocessing folded into the LogisticRegression weights"""
+    num = np.array([[row[j] for j in _NUM_IDX] for row in rows], dtype=np.float64)
+    num = np.where(np.isnan(num), _NUM_FILL, num)
+    cat = np.fromiter(
+        (sum(lookup.get(row[j], 0.0) for j, lookup in _CAT_COEF) for row in rows),
+        dtype=np.float64,
+        count=len(rows),
+    )
+    p = 1.0 / (1.0 + np.exp(-(num @ _NUM_COEF + cat + _INTERCEPT)))
+    return np.column_stack([1.0 - p, p])
+
+def _fold_linear_pipeline(pre, coef: np.ndarray, intercept: float):
+    """Fold train.py's num (median impute + scale) and cat (impute + one-hot) branches
+    into the LogisticRegression weights; None if the preprocessor has any other shape"""
+    from sklearn.impute import SimpleImputer
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+    
+    branches = {name: (trans, cols) for name, trans, cols in pre.transformers_ if name != "remainder"}
+    if list(branches) != ["num", "cat"] or any(t != "drop" for n, t, _ in pre.transformers_ if n == "remainder"):
+        return None
+    (num_pipe, num_cols), (cat_pipe, cat_cols) = branches["num"], branches["cat"]
+    num_steps = getattr(num_pipe, "named_steps", {})
+    cat_steps = getattr(cat_pipe, "named_steps", {})
+    if list(num_steps) != ["impute", "scale"] or list(cat_steps) != ["impute", "onehot"]:
+        return None
+    num_imp, scaler = num_steps["impute"], num_steps["scale"]
+    cat_imp, ohe = cat_steps["impute"], cat_steps["onehot"]
+    if not (
+        isinstance(num_imp, SimpleImputer) and isinstance(scaler, StandardScaler)
+        and isinstance(cat_imp, SimpleImputer) and isinstance(ohe, OneHotEncoder)
+        and ohe.handle_unknown == "ignore" and ohe.drop is None
+        and ohe.min_frequency is None and ohe.max_categories is None
+        and len(coef) == len(num_cols) + sum(len(c) for c in ohe.categories_)
+    ):
+        return None
     
-    # Train model if needed
-    _train_model_if_needed()
+    mean = scaler.mean_ if scaler.mean_ is not None else np.zeros(len(num_cols))
+    scale = scaler.scale_ if scaler.scale_ is not None else np.ones(len(num_cols))
+    num_coef = coef[:len(num_cols)] / scale
+    intercept -= float(num_coef @ mean)
     
-    root = Path(__file__).resolve().parents[1]
-    best = root / "models" / "credit_model_best.joblib"
-    path = best if best.exists() else (root / "models" / "credit_model.joblib")
+    cat_coef, offset = [], len(num_cols)
+    for col, categories in zip(cat_cols, ohe.categories_):
+        # CreditRequest's str fields are never missing, so the cat imputer is a no-op here;
+        # unknown categories contribute nothing, as with handle_unknown="ignore"
+        lookup = {cat: float(w) for cat, w in zip(categories.tolist(), coef[offset:offset + len(categories)])}
+        cat_coef.append((_FEATURE_COLUMNS.index(col), lookup))
+        offset += len(categories)
+    
+    num_idx = [_FEATURE_COLUMNS.index(col) for col in num_cols]
+    return num_idx, num_coef, np.asarray(num_imp.statistics_, dtype=np.float64), cat_coef, intercept
+
+def _is_linear_pipeline(pipe) -> bool:
+    from sklearn.linear_model import LogisticRegression
+    steps = getattr(pipe, "named_steps", {})
+    return (
+        list(steps) == ["pre", "clf"]
+        and isinstance(steps["clf"], LogisticRegression)
+        and steps["clf"].coef_.shape[0] == 1
+    )
+
+def _warm_up():
+    """Score one dummy row so the first real request doesn't pay first-call costs"""
+    try:
+        _PREDICT_PROBA(_model_input([tuple("" if col in _CAT_COLS else 0 for col in _FEATURE_COLUMNS)]))
+    except Exception as e:
+        print(f"⚠️ Model warm-up failed: {e}")
+    # Compiles the batch risk kernel now when numba is installed
+    risk_codes(np.zeros(1), _THRESHOLDS)
+
+def _load_bundle(path: Path | None = None):
+    global _BUNDLE, _PIPE, _FEATURE_COLUMNS, _THRESHOLDS, _CATEGORIZE, _PROBA_IDX
+    global _CAT_MAPS, _CODE_LUT, _PREDICT_PROBA, _RAW_ROWS
+    global _NUM_IDX, _NUM_COEF, _NUM_FILL, _CAT_COEF, _INTERCEPT
+    
+    if path is None:
+        # Train model if needed
+        _train_model_if_needed()
+        
+        path = _BEST_PATH if _BEST_PATH.exists() else _REGULAR_PATH
     
     if not path.exists():
         raise FileNotFoundError(f"Model still not found at {path}")
     
-    _BUNDLE = joblib.load(path)
+    # Memory-mapped and cached per file, so repeated startups in one process
+    # (tests, reloads) reuse the same unpickled bundle
+    _BUNDLE = load_bundle(path)
     _PIPE = _BUNDLE["pipeline"]
-    _FEATURE_COLUMNS = _BUNDLE["feature_columns"]
+    _FEATURE_COLUMNS = tuple(_BUNDLE["feature_columns"])
+    if _FEATURE_COLUMNS != _FIELDS:
+        raise RuntimeError(
+            f"Model feature columns {list(_FEATURE_COLUMNS)} do not match CreditRequest fields {list(_FIELDS)}"
+        )
     _THRESHOLDS = _BUNDLE.get("thresholds", {"low": 0.20, "medium": 0.50})
+    _CATEGORIZE = make_categorizer(_THRESHOLDS)
+    _CAT_MAPS = _BUNDLE.get("category_maps", {})
+    _CODE_LUT = tuple(_CAT_MAPS.get(col) for col in _FEATURE_COLUMNS)
     
     # Find the index for 'bad' class
     if hasattr(_PIPE, 'classes_'):
@@ -177,378 +330,198 @@ def _load_bundle():
         _PROBA_IDX = classes.index("bad") if "bad" in classes else 1
     else:
         _PROBA_IDX = 1  # Default assumption
+    
+    _PREDICT_PROBA = _PIPE.predict_proba
+    if _is_linear_pipeline(_PIPE):
+        clf = _PIPE.named_steps["clf"]
+        coef = np.asarray(clf.coef_[0], dtype=np.float64)
+        folded = _fold_linear_pipeline(_PIPE.named_steps["pre"], coef, float(clf.intercept_[0]))
+        if folded is not None:
+            _NUM_IDX, _NUM_COEF, _NUM_FILL, _CAT_COEF, _INTERCEPT = folded
+            _PREDICT_PROBA = _folded_predict_proba
+    _RAW_ROWS = _PREDICT_PROBA is _folded_predict_proba
+    
+    _warm_up()
 
-@app.on_event("startup")
-def on_startup():
+def _tiled_predict_proba(X):
+    if len(X) <= _TILE_ROWS:
+        return _PREDICT_PROBA(X)
+    return np.concatenate([_PREDICT_PROBA(X[i:i + _TILE_ROWS]) for i in range(0, len(X), _TILE_ROWS)])
+
+async def _predict_proba(X):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, _tiled_predict_proba, X)
+
+def _stack_rows(rows: list):
+    """Stack single-request rows from predict() into one model input"""
+    if _CAT_MAPS:
+        return np.vstack(rows)
+    return _model_input(rows)
+
+async def _score_batch(rows: list, futs: list):
+    try:
+        probs = (await _predict_proba(_stack_rows(rows)))[:, _PROBA_IDX]
+    except Exception as e:
+        for fut in futs:
+            if not fut.done():
+                fut.set_exception(e)
+    else:
+        for fut, p in zip(futs, probs.tolist()):
+            if not fut.done():
+                fut.set_result(p)
+
+async def _batcher():
+    loop = asyncio.get_running_loop()
+    in_flight: set[asyncio.Task] = set()
+    while True:
+        row, fut = await _INBOX.get()
+        rows, futs = [row], [fut]
+        # Let handlers that are already runnable enqueue their rows first
+        await asyncio.sleep(0)
+        deadline = loop.time() + _BATCH_MAX_WAIT
+        while len(rows) < _BATCH_MAX_SIZE:
+            try:
+                row, fut = _INBOX.get_nowait()
+            except asyncio.QueueEmpty:
+                timeout = deadline - loop.time()
+                if not in_flight or timeout <= 0:
+                    break
+                try:
+                    row, fut = await asyncio.wait_for(_INBOX.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            rows.append(row)
+            futs.append(fut)
+        
+        task = asyncio.create_task(_score_batch(rows, futs))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+async def _predict_one(row) -> float:
+    fut = asyncio.get_running_loop().create_future()
+    await _INBOX.put((row, fut))
+    return await fut
+
+# With CREDIT_API_PRELOAD=1 the bundle loads at import, i.e. once in the gunicorn
+# master under --preload, and forked workers share its pages copy-on-write
+_PRELOAD = os.environ.get("CREDIT_API_PRELOAD") == "1"
+if _PRELOAD:
     _load_bundle()
 
+@app.on_event("startup")
+async def on_startup():
+    global _INBOX, _BATCHER
+    if not _PRELOAD:
+        _load_bundle()
+    _INBOX = asyncio.Queue()
+    _BATCHER = asyncio.create_task(_batcher())
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    if _BATCHER is not None:
+        _BATCHER.cancel()
+
 @app.get("/", response_class=HTMLResponse)
-def root():
-    return """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>🏦 Credit Risk Assessment</title>
-        <style>
-            * { margin: 0; padding: 0; box-sizing: border-box; }
-            body { 
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                padding: 20px;
-            }
-            .container { 
-                max-width: 800px; 
-                margin: 0 auto; 
-                background: white; 
-                border-radius: 15px; 
-                box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-                overflow: hidden;
-            }
-            .header { 
-                background: linear-gradient(135deg, #2c3e50, #34495e);
-                color: white; 
-                padding: 30px; 
-                text-align: center; 
-            }
-            .header h1 { font-size: 2.5em; margin-bottom: 10px; }
-            .header p { opacity: 0.9; font-size: 1.1em; }
-            .form-container { padding: 30px; }
-            .form-grid { 
-                display: grid; 
-                grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); 
-                gap: 20px; 
-                margin-bottom: 30px; 
-            }
-            .form-group { margin-bottom: 20px; }
-            .form-group label { 
-                display: block; 
-                margin-bottom: 8px; 
-                font-weight: 600; 
-                color: #2c3e50;
-                font-size: 14px;
-            }
-            .form-group input, .form-group select { 
-                width: 100%; 
-                padding: 12px; 
-                border: 2px solid #e1e8ed; 
-                border-radius: 8px; 
-                font-size: 14px;
-                transition: border-color 0.3s;
-            }
-            .form-group input:focus, .form-group select:focus { 
-                outline: none; 
-                border-color: #667eea; 
-                box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-            }
-            .predict-btn { 
-                width: 100%; 
-                background: linear-gradient(135deg, #667eea, #764ba2); 
-                color: white; 
-                padding: 15px 30px; 
-                border: none; 
-                border-radius: 8px; 
-                font-size: 16px; 
-                font-weight: 600; 
-                cursor: pointer; 
-                transition: transform 0.2s;
-            }
-            .predict-btn:hover { transform: translateY(-2px); }
-            .predict-btn:disabled { 
-                background: #bbb; 
-                cursor: not-allowed; 
-                transform: none;
-            }
-            .result { 
-                margin-top: 30px; 
-                padding: 20px; 
-                border-radius: 8px; 
-                text-align: center; 
-                font-size: 18px; 
-                font-weight: 600;
-            }
-            .result.low { background: #d4edda; color: #155724; border: 2px solid #c3e6cb; }
-            .result.medium { background: #fff3cd; color: #856404; border: 2px solid #ffeaa7; }
-            .result.high { background: #f8d7da; color: #721c24; border: 2px solid #f5c6cb; }
-            .footer { 
-                text-align: center; 
-                padding: 20px; 
-                background: #f8f9fa; 
-                color: #6c757d; 
-            }
-            .footer a { color: #667eea; text-decoration: none; }
-            .loading { display: none; }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🏦 Credit Risk Assessment</h1>
-                <p>AI-Powered Credit Scoring System</p>
-            </div>
-            
-            <div class="form-container">
-                <form id="creditForm">
-                    <div class="form-grid">
-                        <div class="form-group">
-                            <label>Checking Account Status</label>
-                            <select name="checking_status" required>
-                                <option value="">Select...</option>
-                                <option value="<0">< 0 DM</option>
-                                <option value="0<=X<200">0 <= X < 200 DM</option>
-                                <option value=">=200">>= 200 DM</option>
-                                <option value="no checking">No checking account</option>
-                            </select>
-                        </div>
-                        
-                        <div class="form-group">
-                            <label>Credit Duration (months)</label>
-                            <input type="number" name="duration" required min="1" max="72" placeholder="e.g., 12">
-                        </div>
-                        
-                        <div class="form-group">
-                            <label>Credit History</label>
-                            <select name="credit_history" required>
-                                <option value="">Select...</option>
-                                <option value="no credits/all paid">No credits taken/all paid</option>
-                                <option value="all paid">All credits paid back</option>
-                                <option value="existing paid">Existing credits paid to date</option>
-                                <option value="delayed previously">Delayed payment in past</option>
-                                <option value="critical/other existing credit">Critical account/other credits existing</option>
-                            </select>
-                        </div>
-                        
-                        <div class="form-group">
-                            <label>Purpose</label>
-                            <select name="purpose" required>
-                                <option value="">Select...</option>
-                                <option value="car (new)">Car (new)</option>
-                                <option value="car (used)">Car (used)</option>
-                                <option value="furniture/equipment">Furniture/Equipment</option>
-                                <option value="radio/television">Radio/Television</option>
-                                <option value="domestic appliances">Domestic Appliances</option>
-                                <option value="repairs">Repairs</option>
-                                <option value="education">Education</option>
-                                <option value="vacation">Vacation</option>
-                                <option value="retraining">Retraining</option>
-                                <option value="business">Business</option>
-                                <option value="others">Others</option>
-                            </select>
-                        </div>
-                        
-                        <div class="form-group">
-                            <label>Credit Amount (DM)</label>
-                            <input type="number" name="credit_amount" required min="1" placeholder="e.g., 5000">
-                        </div>
-                        
-                        <div class="form-group">
-                            <label>Savings Account Balance</label>
-                            <select name="savings_status" required>
-                                <option value="">Select...</option>
-                                <option value="<100">< 100 DM</option>
-                                <option value="100<=X<500">100 <= X < 500 DM</option>
-                                <option value="500<=X<1000">500 <= X < 1000 DM</option>
-                                <option value=">=1000">>= 1000 DM</option>
-                                <option value="no known savings">No savings account</option>
-                            </select>
-                        </div>
-                        
-                        <div class="form-group">
-                            <label>Employment Duration</label>
-                            <select name="employment" required>
-                                <option value="">Select...</option>
-                                <option value="unemployed">Unemployed</option>
-                                <option value="<1">< 1 year</option>
-                                <option value="1<=X<4">1 <= X < 4 years</option>
-                                <option value="4<=X<7">4 <= X < 7 years</option>
-                                <option value=">=7">>= 7 years</option>
-                            </select>
-                        </div>
-                        
-                        <div class="form-group">
-                            <label>Age</label>
-                            <input type="number" name="age" required min="18" max="100" placeholder="e.g., 35">
-                        </div>
-                        
-                        <div class="form-group">
-                            <label>Personal Status</label>
-                            <select name="personal_status" required>
-                                <option value="">Select...</option>
-                                <option value="male div/sep">Male divorced/separated</option>
-                                <option value="female div/dep/mar">Female divorced/dependent/married</option>
-                                <option value="male single">Male single</option>
-                                <option value="male mar/wid">Male married/widowed</option>
-                                <option value="female single">Female single</option>
-                            </select>
-                        </div>
-                        
-                        <div class="form-group">
-                            <label>Housing</label>
-                            <select name="housing" required>
-                                <option value="">Select...</option>
-                                <option value="rent">Rent</option>
-                                <option value="own">Own</option>
-                                <option value="for free">For free</option>
-                            </select>
-                        </div>
-                        
-                        <div class="form-group">
-                            <label>Job</label>
-                            <select name="job" required>
-                                <option value="">Select...</option>
-                                <option value="unemployed/unskilled - non-resident">Unemployed/Unskilled non-resident</option>
-                                <option value="unskilled - resident">Unskilled resident</option>
-                                <option value="skilled">Skilled employee/official</option>
-                                <option value="management/self-employed/highly qualified">Management/Self-employed/Highly qualified</option>
-                            </select>
-                        </div>
-                        
-                        <div class="form-group">
-                            <label>Own Telephone</label>
-                            <select name="own_telephone" required>
-                                <option value="">Select...</option>
-                                <option value="yes">Yes</option>
-                                <option value="no">No</option>
-                            </select>
-                        </div>
-                    </div>
-                    
-                    <!-- Hidden fields with default values -->
-                    <input type="hidden" name="installment_commitment" value="2">
-                    <input type="hidden" name="other_parties" value="none">
-                    <input type="hidden" name="residence_since" value="3">
-                    <input type="hidden" name="property_magnitude" value="real estate">
-                    <input type="hidden" name="other_payment_plans" value="none">
-                    <input type="hidden" name="existing_credits" value="1">
-                    <input type="hidden" name="num_dependents" value="1">
-                    <input type="hidden" name="foreign_worker" value="yes">
-                    
-                    <button type="submit" class="predict-btn">
-                        <span class="btn-text">🔮 Assess Credit Risk</span>
-                        <span class="loading">⏳ Analyzing...</span>
-                    </button>
-                </form>
-                
-                <div id="result" class="result" style="display: none;"></div>
-            </div>
-            
-            <div class="footer">
-                <p>Powered by AI • <a href="/docs">API Documentation</a> • <a href="/health">Health Check</a></p>
-            </div>
-        </div>
-        
-        <script>
-            document.getElementById('creditForm').addEventListener('submit', async function(e) {
-                e.preventDefault();
-                
-                const btn = document.querySelector('.predict-btn');
-                const btnText = document.querySelector('.btn-text');
-                const loading = document.querySelector('.loading');
-                const result = document.getElementById('result');
-                
-                // Show loading state
-                btn.disabled = true;
-                btnText.style.display = 'none';
-                loading.style.display = 'inline';
-                result.style.display = 'none';
-                
-                try {
-                    const formData = new FormData(e.target);
-                    const data = Object.fromEntries(formData.entries());
-                    
-                    // Convert numeric fields
-                    data.duration = parseInt(data.duration);
-                    data.credit_amount = parseInt(data.credit_amount);
-                    data.age = parseInt(data.age);
-                    data.installment_commitment = parseInt(data.installment_commitment);
-                    data.residence_since = parseInt(data.residence_since);
-                    data.existing_credits = parseInt(data.existing_credits);
-                    data.num_dependents = parseInt(data.num_dependents);
-                    
-                    const response = await fetch('/predict', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify(data)
-                    });
-                    
-                    if (!response.ok) {
-                        throw new Error('Prediction failed');
-                    }
-                    
-                    const prediction = await response.json();
-                    const probability = (prediction.prob_default * 100).toFixed(1);
-                    const risk = prediction.risk.toUpperCase();
-                    
-                    result.className = `result ${prediction.risk}`;
-                    result.innerHTML = `
-                        <div style="font-size: 24px; margin-bottom: 10px;">
-                            ${risk === 'LOW' ? '✅' : risk === 'MEDIUM' ? '⚠️' : '❌'} ${risk} RISK
-                        </div>
-                        <div>Default Probability: <strong>${probability}%</strong></div>
-                        <div style="margin-top: 15px; font-size: 14px; opacity: 0.8;">
-                            ${risk === 'LOW' ? 'Good creditworthiness - Low risk of default' : 
-                              risk === 'MEDIUM' ? 'Moderate creditworthiness - Careful evaluation needed' : 
-                              'Poor creditworthiness - High risk of default'}
-                        </div>
-                    `;
-                    result.style.display = 'block';
-                    
-                } catch (error) {
-                    result.className = 'result high';
-                    result.innerHTML = '❌ Error: Unable to assess credit risk. Please try again.';
-                    result.style.display = 'block';
-                } finally {
-                    // Reset button state
-                    btn.disabled = false;
-                    btnText.style.display = 'inline';
-                    loading.style.display = 'none';
-                }
-            });
-        </script>
-    </body>
-    </html>
-    """
+async def root():
+    return HTMLResponse(content=_ROOT_HTML_BYTES, headers={"Cache-Control": "public, max-age=3600"})
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok", "model_loaded": _BUNDLE is not None}
 
-@app.post("/predict", response_model=CreditResponse)
-def predict(sample: CreditRequest) -> CreditResponse:
+@app.post("/predict", response_model=CreditResponse, response_class=ORJSONResponse)
+async def predict(sample: CreditRequest) -> CreditResponse:
     if _PIPE is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
     
+    if _CAT_MAPS:
+        # Fallback model: fill a numeric row directly, encoding categoricals via lookup
+        values = (
+            value if lut is None else lut.get(value, -1)
+            for value, lut in zip(sample.__dict__.values(), _CODE_LUT)
+        )
+        row = np.fromiter(values, dtype=np.float32, count=len(_FEATURE_COLUMNS))
+    else:
+        # Trained pipeline selects and encodes columns by name itself
+        row = tuple(sample.__dict__.values())
+    
     try:
-        X = pd.DataFrame([sample.model_dump()]).reindex(columns=_FEATURE_COLUMNS)
-        
-        # Simple encoding for categorical variables (for fallback model)
-        for col in X.select_dtypes(include=['object']).columns:
-            X[col] = X[col].astype('category').cat.codes
-        
-        proba_bad = float(_PIPE.predict_proba(X)[0, _PROBA_IDX])
-        return CreditResponse(prob_default=proba_bad, risk=categorize(proba_bad, _THRESHOLDS))
-    except Exception as e:
-        # Return a demo prediction if model fails
-        demo_prob = min(max(sample.credit_amount / 20000.0, 0.1), 0.9)
-        return CreditResponse(prob_default=demo_prob, risk=categorize(demo_prob, _THRESHOLDS))
-
-@app.post("/predict_batch", response_model=List[CreditResponse])
-def predict_batch(samples: List[CreditRequest]) -> List[CreditResponse]:
-    if not samples:
-        return []
+        proba_bad = await _predict_one(row)
+    except (ValueError, KeyError) as e:
+        print(f"❌ Prediction failed: {e}")
+        raise HTTPException(status_code=500, detail="Prediction failed")
+    return CreditResponse.model_construct(prob_default=proba_bad, risk=_CATEGORIZE(proba_bad))
+
+@app.post("/demo", response_model=CreditResponse, response_class=ORJSONResponse)
+async def demo(sample: CreditRequest) -> CreditResponse:
+    """Model-free demo score derived from the credit amount"""
+    demo_prob = min(max(sample.credit_amount / 20000.0, 0.1), 0.9)
+    return CreditResponse.model_construct(prob_default=demo_prob, risk=_CATEGORIZE(demo_prob))
+
+# Both batch routes take a raw Request; describe the body for the docs by hand
+_BATCH_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {"type": "array", "items": {"$ref": "#/components/schemas/CreditRequest"}}
+            }
+        },
+    }
+}
+
+async def _score_rows(rows: list[tuple[Any, ...]]) -> ORJSONResponse:
+    if not rows:
+        return ORJSONResponse([])
+    if _PIPE is None:
+        raise HTTPException(status_code=503, detail="Model not loaded")
     
-    results = []
-    for sample in samples:
-        try:
-            result = predict(sample)
-            results.append(result)
-        except Exception:
-            # Fallback prediction
-            demo_prob = min(max(sample.credit_amount / 20000.0, 0.1), 0.9)
-            results.append(CreditResponse(prob_default=demo_prob, risk=categorize(demo_prob, _THRESHOLDS)))
+    # One N-row matrix and a single predict_proba call for the whole batch
+    try:
+        probs = (await _predict_proba(_model_input(rows)))[:, _PROBA_IDX]
+    except (ValueError, KeyError) as e:
+        print(f"❌ Batch prediction failed: {e}")
+        raise HTTPException(status_code=500, detail="Prediction failed")
     
-    return results
\ No newline at end of file
+    risks = categorize_many(probs, _THRESHOLDS)
+    return ORJSONResponse([{"prob_default": float(p), "risk": r} for p, r in zip(probs, risks)])
+
+@app.post(
+    "/predict_batch",
+    # Responses are serialized straight from plain dicts; keep the schema for the docs
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[CreditResponse]}},
+    openapi_extra=_BATCH_OPENAPI,
+)
+async def predict_batch(request: Request) -> ORJSONResponse:
+    try:
+        samples = _BATCH_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError([{**err, "loc": ("body", *err["loc"])} for err in e.errors()])
+    return await _score_rows([tuple(s.__dict__.values()) for s in samples])
+
+@app.post(
+    "/predict_batch_fast",
+    include_in_schema=_FAST_BATCH_ENABLED,
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[CreditResponse]}},
+    openapi_extra=_BATCH_OPENAPI,
+)
+async def predict_batch_fast(request: Request) -> ORJSONResponse:
+    """/predict_batch with a plain type check instead of pydantic validation, for
+    trusted upstream callers that already send complete CreditRequest objects"""
+    if not _FAST_BATCH_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+    try:
+        rows = [tuple(item[col] for col in _FEATURE_COLUMNS) for item in orjson.loads(await request.body())]
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=f"Missing field {e.args[0]!r}")
+    except (orjson.JSONDecodeError, TypeError):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array of objects")
+    for i, row in enumerate(rows):
+        if not all(map(isinstance, row, _FIELD_TYPES)):
+            col = next(c for c, v, t in zip(_FEATURE_COLUMNS, row, _FIELD_TYPES) if not isinstance(v, t))
+            raise HTTPException(status_code=400, detail=f"Item {i}: invalid value for {col!r}")
+    return await _score_rows(rows)
@@ -5,7 +5,7 @@ import numpy as np
 import pandas as pd
 from sklearn.model_selection import StratifiedKFold, GridSearchCV, train_test_split
 from sklearn.metrics import roc_auc_score, accuracy_score, f1_score
-from .train import load_data, build_pipeline, RANDOM_STATE, THRESHOLDS
+from .train import load_data, build_pipeline, save_plots, RANDOM_STATE, THRESHOLDS, EMIT_PLOTS
 
 def main():
     root = Path(__file__).resolve().parents[1]
@@ -19,10 +19,13 @@ def main():
     cat_cols = [c for c in X.columns if c not in num_cols]
 
     pipe = build_pipeline(num_cols, cat_cols)
+    # lbfgs covers the l2-only grid below and fits a little faster than liblinear at
+    # this size; the parallelism comes from GridSearchCV running folds across workers
+    pipe.set_params(clf__solver="lbfgs")
 
     param_grid = {
         "clf__C": [0.1, 0.3, 1.0, 3.0, 10.0],
-        "clf__penalty": ["l2"],  # liblinear supports l2
+        "clf__penalty": ["l2"],  # lbfgs supports l2
     }
 
     cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=RANDOM_STATE)
@@ -32,11 +35,14 @@ def main():
         scoring="roc_auc",
         cv=cv,
         n_jobs=-1,
+        pre_dispatch="2*n_jobs",
         return_train_score=True,
         verbose=1,
     )
+    # Hold out the test split first so the refit best model never sees it
+    X_tr, X_te, y_tr, y_te = train_test_split(X, y, test_size=0.2, stratify=y, random_state=RANDOM_STATE)
     print("Running GridSearchCV...")
-    gs.fit(X, y)
+    gs.fit(X_tr, y_tr)
 
     # Save CV results
     cv_results = pd.DataFrame(gs.cv_results_)
@@ -46,12 +52,8 @@ def main():
     print("Saved:", reports_dir / "best_params.json")
     print("Best AUC:", gs.best_score_)
 
-    # Holdout evaluation with best model
-    X_tr, X_te, y_tr, y_te = train_test_split(X, y, test_size=0.2, stratify=y, random_state=RANDOM_STATE)
+    # Holdout evaluation with best model (already refit on X_tr by GridSearchCV)
     best = gs.best_estimator_
-    best.fit(X_tr, y_tr)
-    from sklearn.metrics import RocCurveDisplay, ConfusionMatrixDisplay
-    import matplotlib.pyplot as plt
     proba_bad = best.predict_proba(X_te)[:, list(best.classes_).index("bad")]
     y_pred = np.where(proba_bad >= 0.5, "bad", "good")
     metrics = {
@@ -65,21 +67,12 @@ def main():
     print("Saved:", reports_dir / "metrics_cv.json")
 
     # Plots
-    fig, ax = plt.subplots(figsize=(6,5), dpi=120)
-    RocCurveDisplay.from_predictions((y_te == "bad").astype(int), proba_bad, ax=ax)
-    ax.set_title("ROC curve (best model)")
-    fig.tight_layout()
-    fig.savefig(reports_dir / "roc_curve_cv.png")
-    plt.close(fig)
-
-    fig, ax = plt.subplots(figsize=(5,4), dpi=120)
-    ConfusionMatrixDisplay.from_predictions(y_te, y_pred, display_labels=["good", "bad"], ax=ax, cmap="Blues")
-    ax.set_title("Confusion Matrix (best model, thr=0.50)")
-    fig.tight_layout()
-    fig.savefig(reports_dir / "confusion_matrix_cv.png")
-    plt.close(fig)
-    print("Saved:", reports_dir / "roc_curve_cv.png")
-    print("Saved:", reports_dir / "confusion_matrix_cv.png")
+    if EMIT_PLOTS:
+        save_plots(
+            y_te, y_pred, proba_bad,
+            reports_dir / "roc_curve_cv.png", "ROC curve (best model)",
+            reports_dir / "confusion_matrix_cv.png", "Confusion Matrix (best model, thr=0.50)",
+        )
 
     # Save best model
     bundle = {
@@ -91,7 +84,7 @@ def main():
         "cat_cols": cat_cols,
         "best_params": gs.best_params_,
     }
-    joblib.dump(bundle, models_dir / "credit_model_best.joblib")
+    joblib.dump(bundle, models_dir / "credit_model_best.joblib", compress=0)  # uncompressed so the API can mmap it
     print("Saved model:", models_dir / "credit_model_best.joblib")
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ import joblib, json
 
 def main():
     root = Path(__file__).resolve().parents[1]
-    bundle = joblib.load(root / "models" / "credit_model.joblib")
+    bundle = joblib.load(root / "models" / "credit_model.joblib", mmap_mode="r")
     cols = bundle["feature_columns"]
     out = root / "data" / "template_input.csv"
     out.parent.mkdir(exist_ok=True)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy handles the default install
+    njit = None
+
+RISK_LABELS = ("low", "medium", "high")
+_LABEL_ARRAY = np.array(RISK_LABELS, dtype=object)
+
+def _risk_codes_numpy(probs, low, medium):
+    # side="left" keeps categorize()'s inclusive upper bounds (p <= low is "low")
+    return np.searchsorted(np.array([low, medium], dtype=probs.dtype), probs, side="left").astype(np.int8)
+
+def _fill_risk_codes(probs, low, medium, out):
+    for i in range(probs.shape[0]):
+        p = probs[i]
+        out[i] = 0 if p <= low else (1 if p <= medium else 2)
+
+# Compiled in-process (no cache=True) so read-only installs never need to write
+# .nbi/.nbc files; the API warms this up at model load
+_fill_risk_codes_jit = njit(_fill_risk_codes) if njit is not None else None
+
+def risk_codes(probs, thresholds: dict[str, float]) -> np.ndarray:
+    """Bucket probabilities into 0/1/2 (low/medium/high) with the same rules as categorize()"""
+    probs = np.ascontiguousarray(probs)
+    if probs.dtype != np.float32:
+        probs = probs.astype(np.float64, copy=False)
+    # Thresholds take the probabilities' dtype so float32 inputs are compared in float32
+    low, medium = probs.dtype.type(thresholds["low"]), probs.dtype.type(thresholds["medium"])
+    if _fill_risk_codes_jit is None:
+        return _risk_codes_numpy(probs, low, medium)
+    out = np.empty(probs.shape[0], dtype=np.int8)
+    _fill_risk_codes_jit(probs, low, medium, out)
+    return out
+
+def categorize_many(probs, thresholds: dict[str, float]) -> list[str]:
+    return _LABEL_ARRAY[risk_codes(probs, thresholds)].tolist()
@@ -1,8 +1,10 @@
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
 import sys
 import json
 import joblib
+import numpy as np
 import pandas as pd
 
 def categorize(prob_default: float, thresholds: dict[str, float]) -> str:
@@ -12,17 +14,41 @@ def categorize(prob_default: float, thresholds: dict[str, float]) -> str:
         return "medium"
     return "high"
 
+def make_categorizer(thresholds: dict[str, float]):
+    """categorize() with the thresholds bound once, for scoring many probabilities"""
+    low, medium = thresholds["low"], thresholds["medium"]
+
+    def _categorize(prob_default: float) -> str:
+        if prob_default <= low:
+            return "low"
+        if prob_default <= medium:
+            return "medium"
+        return "high"
+
+    return _categorize
+
+@lru_cache(maxsize=4)
+def _load_bundle_at(path: str, mtime_ns: int) -> dict:
+    # mtime_ns is part of the cache key so a retrained model on the same path is reloaded
+    return joblib.load(path, mmap_mode="r")
+
+def load_bundle(model_path: Path) -> dict:
+    """Memory-mapped bundle at model_path, cached until the file changes"""
+    model_path = Path(model_path).resolve()
+    return _load_bundle_at(str(model_path), model_path.stat().st_mtime_ns)
+
 def predict_from_dict(sample: dict, model_path: Path | None = None):
     root = Path(__file__).resolve().parents[1]
     if model_path is None:
         best = root / "models" / "credit_model_best.joblib"
         model_path = best if best.exists() else (root / "models" / "credit_model.joblib")
-    bundle = joblib.load(model_path)
+    bundle = load_bundle(model_path)
     pipe = bundle["pipeline"]
     thresholds = bundle.get("thresholds", {"low": 0.20, "medium": 0.50})
     feature_columns = bundle["feature_columns"]
 
-    X = pd.DataFrame([sample]).reindex(columns=feature_columns)
+    # Build the row in model column order directly; missing features become NaN as with reindex
+    X = pd.DataFrame([[sample.get(c, np.nan) for c in feature_columns]], columns=feature_columns)
     proba_bad = pipe.predict_proba(X)[0, list(pipe.classes_).index("bad")]
     risk = categorize(float(proba_bad), thresholds)
     return {"prob_default": float(proba_bad), "risk": risk}
@@ -1,7 +1,7 @@
 from pathlib import Path
 import json
+import os
 import joblib
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from sklearn.datasets import fetch_openml
@@ -11,21 +11,17 @@ from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 from sklearn.impute import SimpleImputer
 from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import (
-    roc_auc_score,
-    accuracy_score,
-    f1_score,
-    RocCurveDisplay,
-    ConfusionMatrixDisplay,
-    classification_report,
-)
+from sklearn.metrics import classification_report
 
 RANDOM_STATE = 42
 THRESHOLDS = {"low": 0.20, "medium": 0.50}  # >0.50 is "high"
+EMIT_PLOTS = os.environ.get("EMIT_PLOTS", "1") == "1"
+
+DATA_HOME = Path(__file__).resolve().parents[1] / ".sklearn_cache"
 
 def load_data():
-    # German Credit dataset (binary: good/bad)
-    data = fetch_openml(name="credit-g", version=1, as_frame=True)
+    # German Credit dataset (binary: good/bad); cached under DATA_HOME after the first download
+    data = fetch_openml(name="credit-g", version=1, as_frame=True, data_home=DATA_HOME)
     df = data.frame
     y = df["class"].astype(str).str.lower()  # good/bad
     X = df.drop(columns=["class"])
@@ -51,10 +47,7 @@ def build_pipeline(num_cols, cat_cols) -> Pipeline:
 
 def evaluate_and_report(y_true, y_pred, y_proba, reports_dir: Path):
     import json
-    import matplotlib.pyplot as plt
     from sklearn.metrics import (
-        RocCurveDisplay,
-        ConfusionMatrixDisplay,
         roc_auc_score,
         accuracy_score,
         f1_score,
@@ -69,25 +62,38 @@ def evaluate_and_report(y_true, y_pred, y_proba, reports_dir: Path):
     reports_dir.mkdir(parents=True, exist_ok=True)
     (reports_dir / "metrics.json").write_text(json.dumps(metrics, indent=2))
 
-    # ROC curve
+    print("Saved:", reports_dir / "metrics.json")
+    if EMIT_PLOTS:
+        save_plots(
+            y_true, y_pred, y_proba,
+            reports_dir / "roc_curve.png", "ROC curve",
+            reports_dir / "confusion_matrix.png", "Confusion Matrix (threshold=0.50)",
+        )
+
+def save_plots(y_true, y_pred, y_proba, roc_path: Path, roc_title: str, cm_path: Path, cm_title: str):
+    import matplotlib
+    matplotlib.use("Agg")  # headless; never probe for a GUI backend
+    import matplotlib.pyplot as plt
+    from sklearn.metrics import RocCurveDisplay, ConfusionMatrixDisplay
+
+    # One figure for both plots: cleared and resized in between
     fig, ax = plt.subplots(figsize=(6, 5), dpi=120)
     RocCurveDisplay.from_predictions((y_true == "bad").astype(int), y_proba, ax=ax)
-    ax.set_title("ROC curve")
+    ax.set_title(roc_title)
     fig.tight_layout()
-    fig.savefig(reports_dir / "roc_curve.png")
-    plt.close(fig)
+    fig.savefig(roc_path)
 
     # Confusion matrix (uses y_pred you passed in at 0.50 threshold)
-    fig, ax = plt.subplots(figsize=(5, 4), dpi=120)
+    ax.clear()
+    fig.set_size_inches(5, 4)
     ConfusionMatrixDisplay.from_predictions(y_true, y_pred, display_labels=["good", "bad"], ax=ax, cmap="Blues")
-    ax.set_title("Confusion Matrix (threshold=0.50)")
+    ax.set_title(cm_title)
     fig.tight_layout()
-    fig.savefig(reports_dir / "confusion_matrix.png")
+    fig.savefig(cm_path)
     plt.close(fig)
 
-    print("Saved:", reports_dir / "metrics.json")
-    print("Saved:", reports_dir / "roc_curve.png")
-    print("Saved:", reports_dir / "confusion_matrix.png")
+    print("Saved:", roc_path)
+    print("Saved:", cm_path)
 
 def main():
     root = Path(__file__).resolve().parents[1]
@@ -146,7 +152,7 @@ def main():
         "num_cols": num_cols,
         "cat_cols": cat_cols,
     }
-    joblib.dump(bundle, model_path)
+    joblib.dump(bundle, model_path, compress=0)  # uncompressed so the API can mmap it
     print("Saved model:", model_path)
 
 if __name__ == "__main__":
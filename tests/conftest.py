@@ -16,7 +16,7 @@ def ensure_model(project_root: Path):
     # Train if model is missing
     model_path = project_root / "models" / "credit_model.joblib"
     if not model_path.exists():
-        import runpy
-        runpy.run_module("src.train", run_name="__main__")
+        from src.train import main as train_main
+        train_main()
     assert model_path.exists(), "Model was not created"
     return model_path
\ No newline at end of file
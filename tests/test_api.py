@@ -0,0 +1,206 @@
+import asyncio
+import time
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+import src.api as api
+from src.api import app
+
+SAMPLE = {
+    "checking_status": "<0",
+    "duration": 12,
+    "credit_history": "existing paid",
+    "purpose": "car (new)",
+    "credit_amount": 2500,
+    "savings_status": "<100",
+    "employment": ">=7",
+    "installment_commitment": 2,
+    "personal_status": "male single",
+    "other_parties": "none",
+    "residence_since": 3,
+    "property_magnitude": "real estate",
+    "age": 35,
+    "other_payment_plans": "none",
+    "housing": "own",
+    "existing_credits": 1,
+    "job": "skilled",
+    "num_dependents": 1,
+    "own_telephone": "yes",
+    "foreign_worker": "yes",
+}
+
+def test_batch_matches_single_predictions(ensure_model):
+    samples = [SAMPLE, {**SAMPLE, "credit_amount": 9000, "duration": 36}]
+    with TestClient(app) as client:
+        singles = [client.post("/predict", json=s).json() for s in samples]
+        batch = client.post("/predict_batch", json=samples).json()
+    assert len(batch) == len(singles)
+    for result, single in zip(batch, singles):
+        assert result["prob_default"] == pytest.approx(single["prob_default"])
+        assert result["risk"] == single["risk"]
+        assert 0.0 <= result["prob_default"] <= 1.0
+        assert result["risk"] in {"low", "medium", "high"}
+
+def test_empty_batch(ensure_model):
+    with TestClient(app) as client:
+        assert client.post("/predict_batch", json=[]).json() == []
+
+def test_root_serves_cached_html(ensure_model):
+    with TestClient(app) as client:
+        resp = client.get("/")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/html")
+    assert resp.headers["cache-control"] == "public, max-age=3600"
+    assert "Credit Risk Assessment" in resp.text
+
+def test_batch_rejects_invalid_items(ensure_model):
+    with TestClient(app) as client:
+        resp = client.post("/predict_batch", json=[{**SAMPLE, "age": "unknown"}])
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["loc"] == ["body", 0, "age"]
+
+def test_fallback_model_single_and_batch_agree(ensure_model, tmp_path, monkeypatch):
+    path = tmp_path / "fallback.joblib"
+    api._create_fallback_model(path)
+    load_bundle = api._load_bundle
+    monkeypatch.setattr(api, "_load_bundle", lambda: load_bundle(path))
+    unknown = {**SAMPLE, "purpose": "spaceship"}
+    samples = [SAMPLE, {**SAMPLE, "credit_amount": 9000, "duration": 36}, unknown]
+    with TestClient(app) as client:
+        assert api._CAT_MAPS, "fallback bundle should carry category maps"
+        singles = [client.post("/predict", json=s).json() for s in samples]
+        batch = client.post("/predict_batch", json=samples).json()
+        X = api._model_input([tuple(s[col] for col in api._FEATURE_COLUMNS) for s in samples])
+        expected = api._PIPE.predict_proba(X)[:, api._PROBA_IDX]
+    assert X.dtype == "float32"
+    assert X[2, api._FEATURE_COLUMNS.index("purpose")] == -1
+    assert len(batch) == len(singles) == len(expected)
+    for result, single, p in zip(batch, singles, expected):
+        assert single["prob_default"] == pytest.approx(p)
+        assert result["prob_default"] == pytest.approx(p)
+        assert result["risk"] == single["risk"]
+
+def test_concurrent_predicts_are_coalesced(ensure_model, monkeypatch):
+    calls = []
+    predict_proba = api._predict_proba
+
+    async def counting_predict_proba(X):
+        calls.append(len(X))
+        return await predict_proba(X)
+
+    monkeypatch.setattr(api, "_predict_proba", counting_predict_proba)
+    samples = [api.CreditRequest(**{**SAMPLE, "credit_amount": 1000 * (i + 1)}) for i in range(8)]
+
+    async def predict_all():
+        return await asyncio.gather(*(api.predict(s) for s in samples))
+
+    with TestClient(app) as client:
+        calls.clear()
+        results = client.portal.call(predict_all)
+        batch = client.post("/predict_batch", json=[s.model_dump() for s in samples]).json()
+    assert calls[0] == len(samples)
+    for result, expected in zip(results, batch):
+        assert result.prob_default == pytest.approx(expected["prob_default"])
+
+def test_model_errors_are_not_masked(ensure_model, monkeypatch):
+    async def failing_predict_proba(X):
+        raise ValueError("bad input")
+
+    monkeypatch.setattr(api, "_predict_proba", failing_predict_proba)
+    with TestClient(app) as client:
+        assert client.post("/predict", json=SAMPLE).status_code == 500
+        assert client.post("/predict_batch", json=[SAMPLE]).status_code == 500
+        demo = client.post("/demo", json=SAMPLE).json()
+    assert demo == {"prob_default": 0.125, "risk": "low"}
+
+def test_tiled_batch_matches_untiled(ensure_model, monkeypatch):
+    samples = [{**SAMPLE, "credit_amount": 1000 * (i + 1)} for i in range(5)]
+    with TestClient(app) as client:
+        untiled = client.post("/predict_batch", json=samples).json()
+        monkeypatch.setattr(api, "_TILE_ROWS", 2)
+        tiled = client.post("/predict_batch", json=samples).json()
+    assert [r["risk"] for r in tiled] == [r["risk"] for r in untiled]
+    assert [r["prob_default"] for r in tiled] == pytest.approx([r["prob_default"] for r in untiled])
+
+def test_folded_fast_path_matches_pipeline(ensure_model):
+    samples = [SAMPLE, {**SAMPLE, "purpose": "spaceship", "age": 70}, {**SAMPLE, "credit_amount": 15000}]
+    with TestClient(app):
+        rows = [tuple(s[col] for col in api._FEATURE_COLUMNS) for s in samples]
+        frame = pd.DataFrame.from_records(rows, columns=api._FEATURE_COLUMNS)
+        assert api._PREDICT_PROBA == api._folded_predict_proba
+        folded = api._folded_predict_proba(api._model_input(rows))
+        reference = api._PIPE.predict_proba(frame)
+    np.testing.assert_allclose(folded, reference)
+
+def test_unfoldable_pipeline_uses_its_own_predict_proba(ensure_model, tmp_path, monkeypatch):
+    from sklearn.preprocessing import MinMaxScaler
+    from src.train import build_pipeline
+
+    num_cols = [c for c, v in SAMPLE.items() if not isinstance(v, str)]
+    cat_cols = [c for c in SAMPLE if c not in num_cols]
+    pipe = build_pipeline(num_cols, cat_cols).set_params(pre__num__scale=MinMaxScaler())
+    X = pd.DataFrame([{**SAMPLE, "credit_amount": 500 * (i + 1), "age": 20 + i} for i in range(20)])
+    pipe.fit(X[list(api._FIELDS)], ["bad", "good"] * 10)
+    path = tmp_path / "minmax.joblib"
+    joblib.dump({"pipeline": pipe, "feature_columns": list(api._FIELDS)}, path)
+    load_bundle = api._load_bundle
+    monkeypatch.setattr(api, "_load_bundle", lambda: load_bundle(path))
+
+    samples = [SAMPLE, {**SAMPLE, "credit_amount": 9000}]
+    with TestClient(app) as client:
+        assert api._PREDICT_PROBA == api._PIPE.predict_proba
+        batch = client.post("/predict_batch", json=samples).json()
+        single = client.post("/predict", json=samples[1]).json()
+    expected = pipe.predict_proba(pd.DataFrame(samples)[list(api._FIELDS)])[:, list(pipe.classes_).index("bad")]
+    np.testing.assert_allclose([r["prob_default"] for r in batch], expected)
+    assert single["prob_default"] == pytest.approx(expected[1])
+
+def test_restarts_reuse_loaded_bundle(ensure_model):
+    with TestClient(app):
+        first = api._BUNDLE
+    with TestClient(app):
+        assert api._BUNDLE is first
+
+def test_fast_batch_matches_validated_batch(ensure_model, monkeypatch):
+    monkeypatch.setattr(api, "_FAST_BATCH_ENABLED", True)
+    # Key order differs from the schema on purpose; rows are built by field name
+    samples = [dict(reversed(SAMPLE.items())), {**SAMPLE, "credit_amount": 9000, "purpose": "spaceship"}]
+    with TestClient(app) as client:
+        validated = client.post("/predict_batch", json=samples).json()
+        fast = client.post("/predict_batch_fast", json=samples).json()
+        assert client.post("/predict_batch_fast", json=[]).json() == []
+        assert client.post("/predict_batch_fast", content=b"not json").status_code == 400
+    assert fast == validated
+
+@pytest.mark.parametrize("body", [
+    [{}],
+    [{"foo": 1}],
+    [{k: v for k, v in SAMPLE.items() if k != "age"}],
+    [{**SAMPLE, "age": "abc"}],
+    [{**SAMPLE, "age": [35]}],
+    [{**SAMPLE, "purpose": {"car": 1}}],
+    [SAMPLE, 3],
+    {"not": "a list"},
+])
+def test_fast_batch_rejects_malformed_items(ensure_model, monkeypatch, body):
+    monkeypatch.setattr(api, "_FAST_BATCH_ENABLED", True)
+    with TestClient(app) as client:
+        assert client.post("/predict_batch_fast", json=body).status_code == 400
+
+def test_fast_batch_is_off_by_default(ensure_model):
+    assert not api._FAST_BATCH_ENABLED
+    with TestClient(app) as client:
+        assert client.post("/predict_batch_fast", json=[SAMPLE]).status_code == 404
+        assert "/predict_batch_fast" not in client.get("/openapi.json").json()["paths"]
+
+def test_lone_predict_skips_batch_window(ensure_model, monkeypatch):
+    monkeypatch.setattr(api, "_BATCH_MAX_WAIT", 2.0)
+    with TestClient(app) as client:
+        client.post("/predict", json=SAMPLE)
+        start = time.perf_counter()
+        resp = client.post("/predict", json=SAMPLE)
+        elapsed = time.perf_counter() - start
+    assert resp.status_code == 200
+    assert elapsed < 1.0
@@ -30,4 +30,28 @@ def test_batch_predict_creates_output(ensure_model, tmp_path: Path):
 
     assert out.exists(), "Output CSV was not created"
     out_df = pd.read_csv(out)
-    assert {"prob_default", "risk"}.issubset(out_df.columns)
\ No newline at end of file
+    assert {"prob_default", "risk"}.issubset(out_df.columns)
+
+def test_batch_predict_chunks_preserve_rows(ensure_model, tmp_path: Path, monkeypatch):
+    import sys
+    from src import batch_predict
+
+    bundle = joblib.load(ensure_model)
+    cols = bundle["feature_columns"]
+    df = pd.DataFrame([{c: None for c in cols} for _ in range(5)])
+    df["duration"] = [6, 12, 24, 36, 48]
+    df["credit_amount"] = [1000, 2500, 4500, 8000, 15000]
+    inp = tmp_path / "input.csv"
+    df.to_csv(inp, index=False)
+
+    outputs = []
+    for chunk_size in (2, 50_000):
+        out = tmp_path / f"out_{chunk_size}.csv"
+        monkeypatch.setattr(batch_predict, "CHUNK_SIZE", chunk_size)
+        monkeypatch.setattr(sys, "argv", ["batch_predict", str(inp), str(out), str(ensure_model)])
+        batch_predict.main()
+        outputs.append(pd.read_csv(out))
+
+    chunked, whole = outputs
+    assert len(chunked) == 5
+    pd.testing.assert_frame_equal(chunked, whole)
@@ -0,0 +1,33 @@
+import numpy as np
+from src import kernels
+from src.kernels import categorize_many, risk_codes
+from src.predict import categorize
+
+THRESHOLDS = {"low": 0.20, "medium": 0.50}
+PROBS = np.array([0.0, 0.2, 0.2000001, 0.5, 0.51, 1.0])
+
+def _expected_codes():
+    return [kernels.RISK_LABELS.index(categorize(float(p), THRESHOLDS)) for p in PROBS]
+
+def test_categorize_many_matches_categorize():
+    assert categorize_many(PROBS, THRESHOLDS) == [categorize(float(p), THRESHOLDS) for p in PROBS]
+    assert risk_codes(PROBS, THRESHOLDS).dtype == np.int8
+
+def test_numpy_fallback_matches_categorize():
+    codes = kernels._risk_codes_numpy(PROBS, THRESHOLDS["low"], THRESHOLDS["medium"])
+    assert codes.dtype == np.int8
+    assert codes.tolist() == _expected_codes()
+
+def test_loop_kernel_matches_categorize():
+    # Undecorated loop, i.e. what numba compiles when it is installed
+    out = np.empty(PROBS.shape[0], dtype=np.int8)
+    kernels._fill_risk_codes(PROBS, THRESHOLDS["low"], THRESHOLDS["medium"], out)
+    assert out.tolist() == _expected_codes()
+
+def test_float32_probs_compare_in_float32():
+    probs = PROBS.astype(np.float32)
+    thresholds32 = {k: float(np.float32(v)) for k, v in THRESHOLDS.items()}
+    expected = [categorize(float(p), thresholds32) for p in probs]
+    assert categorize_many(probs, THRESHOLDS) == expected
+    codes = kernels._risk_codes_numpy(probs, np.float32(THRESHOLDS["low"]), np.float32(THRESHOLDS["medium"]))
+    assert codes.tolist() == risk_codes(probs, THRESHOLDS).tolist()
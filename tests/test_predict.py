@@ -1,6 +1,6 @@
 from pathlib import Path
 import json
-from src.predict import predict_from_dict
+from src.predict import categorize, make_categorizer, predict_from_dict
 
 def test_single_prediction_in_range(ensure_model):
     sample = {
@@ -15,4 +15,19 @@ def test_single_prediction_in_range(ensure_model):
     result = predict_from_dict(sample, model_path=Path(ensure_model))
     assert "prob_default" in result and "risk" in result
     assert 0.0 <= result["prob_default"] <= 1.0
-    assert result["risk"] in {"low", "medium", "high"}
\ No newline at end of file
+    assert result["risk"] in {"low", "medium", "high"}
+
+def test_make_categorizer_matches_categorize():
+    thresholds = {"low": 0.20, "medium": 0.50}
+    bound = make_categorizer(thresholds)
+    for p in (0.0, 0.2, 0.21, 0.5, 0.51, 1.0):
+        assert bound(p) == categorize(p, thresholds)
+
+def test_bundle_is_loaded_once(ensure_model):
+    from src import predict
+    predict._load_bundle_at.cache_clear()
+    sample = {"duration": 12, "credit_amount": 2500, "age": 35}
+    first = predict_from_dict(sample, model_path=Path(ensure_model))
+    second = predict_from_dict(sample, model_path=Path(ensure_model))
+    assert first == second
+    assert predict._load_bundle_at.cache_info().misses == 1